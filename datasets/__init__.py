@@ -3,6 +3,7 @@ import importlib
 from .blog_rec import BLOG_REC
 from .movie import MOVIE
 from .book import BOOK
+from .cache import CacheManager
 DATASETS = {
     "BLOG_REC": BLOG_REC,
     "MOVIE": MOVIE,
@@ -18,5 +19,5 @@ for dataset in DATASETS:
     # NUM_LINES[dataset] = dataset_module.NUM_LINES
     # MD5[dataset] = dataset_module.MD5
 
-__all__ = sorted(list(map(str, DATASETS.keys())))
+__all__ = sorted(list(map(str, DATASETS.keys()))) + ["CacheManager"]
 
@@ -0,0 +1,177 @@
+import os
+import shutil
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed
+from typing import Dict, List, Optional, Union
+from reclab import _CACHE_DIR
+from reclab.datasets.utils import _FileLock
+from reclab.datasets.multiTableDataset import MultiTableDataset
+
+
+def _get_datasets():
+    # Imported lazily, reclab.datasets imports this module
+    from reclab.datasets import DATASETS
+    return DATASETS
+
+
+def _extract_dataset(dataset: MultiTableDataset) -> None:
+    # Runs in a worker process, decompression is CPU bound
+    dataset._extract_if_needed()
+
+
+def _dir_size(path: str) -> int:
+    # Unlocked, so files may be renamed into place or removed while we walk.
+    # In-progress `.part` downloads and extractions are not counted.
+    total = 0
+    for dirpath, dirnames, filenames in os.walk(path):
+        dirnames[:] = [d for d in dirnames if not d.endswith(".part")]
+        for filename in filenames:
+            if filename.endswith(".part"):
+                continue
+            file_path = os.path.join(dirpath, filename)
+            if os.path.islink(file_path):
+                continue
+            try:
+                total += os.path.getsize(file_path)
+            except OSError:
+                continue
+    return total
+
+
+class CacheManager:
+    def __init__(self, root: str = _CACHE_DIR):
+        """
+        Prepare, measure and prune the local dataset cache.
+
+        Args:
+            root (str): Cache root, datasets live under `<root>/datasets/<NAME>`
+        """
+        self.root = root
+
+    def _check_names(self, names: Optional[Union[str, List[str]]]) -> List[str]:
+        datasets = _get_datasets()
+        if names is None:
+            return list(datasets.keys())
+        if isinstance(names, str):
+            names = [names]
+        unknown = [name for name in names if name not in datasets]
+        if unknown:
+            raise ValueError(
+                f"Unknown datasets {unknown}. Please choose from {sorted(datasets.keys())}."
+            )
+        return list(names)
+
+    def dataset_root(self, name: str) -> str:
+        """Return the cache directory of a dataset."""
+        return os.path.join(self.root, "datasets", self._check_names(name)[0])
+
+    def prepare(
+        self,
+        names: Optional[Union[str, List[str]]] = None,
+        max_workers: Optional[int] = None,
+        use_processes: bool = True
+    ) -> Dict[str, MultiTableDataset]:
+        """
+        Download and extract several datasets concurrently.
+
+        Downloads run in a thread pool, extraction runs in a process pool and starts
+        for each dataset as soon as its download finishes. Every artifact is guarded
+        by a file lock, so concurrent processes on the same node prepare each dataset
+        only once. If some datasets fail, the others are still prepared and a
+        RuntimeError naming the failed datasets is raised at the end.
+
+        Args:
+            names (str or List[str], optional): Datasets to prepare, all datasets by default
+            max_workers (int, optional): Maximum number of concurrent workers per stage
+            use_processes (bool): Extract in worker processes instead of threads
+        """
+        datasets = _get_datasets()
+        names = self._check_names(names)
+        if max_workers is None:
+            max_workers = len(names)
+        prepared = {name: datasets[name](root=self.root) for name in names}
+        if not prepared:
+            return prepared
+
+        # Each dataset is extracted as soon as its own download finishes, so one slow
+        # download does not hold back the datasets that already arrived
+        errors = {}
+        pool = ProcessPoolExecutor if use_processes else ThreadPoolExecutor
+        with ThreadPoolExecutor(max_workers=max_workers) as downloader, \
+                pool(max_workers=max_workers) as extractor:
+            downloads = {
+                downloader.submit(ds._download_if_needed): name for name, ds in prepared.items()
+            }
+            extractions = {}
+            for future in as_completed(downloads):
+                name = downloads[future]
+                try:
+                    future.result()
+                except Exception as e:
+                    errors[name] = e
+                    continue
+                extractions[extractor.submit(_extract_dataset, prepared[name])] = name
+            for future in as_completed(extractions):
+                name = extractions[future]
+                try:
+                    future.result()
+                except Exception as e:
+                    errors[name] = e
+
+        if errors:
+            details = ", ".join(f"{name}: {e!r}" for name, e in sorted(errors.items()))
+            raise RuntimeError(f"Failed to prepare datasets {sorted(errors)} ({details})") \
+                from next(iter(errors.values()))
+
+        return prepared
+
+    def size(self, names: Optional[Union[str, List[str]]] = None) -> Dict[str, int]:
+        """Return the on-disk size in bytes of each cached dataset, excluding in-progress `.part` files."""
+        result = {}
+        for name in self._check_names(names):
+            dataset_root = self.dataset_root(name)
+            result[name] = _dir_size(dataset_root) if os.path.isdir(dataset_root) else 0
+        return result
+
+    def total_size(self) -> int:
+        """Return the on-disk size in bytes of the whole dataset cache."""
+        return sum(self.size().values())
+
+    def prune(
+        self,
+        names: Optional[Union[str, List[str]]] = None,
+        keep_archive: bool = False
+    ) -> int:
+        """
+        Remove cached datasets and return the number of bytes freed.
+
+        Pruning waits for any process that is downloading or extracting the dataset,
+        but readers do not take a lock. Do not prune a dataset while another process
+        is reading its tables. On POSIX an open reader keeps its file, but on Windows
+        the removal fails partway and leaves the dataset half pruned.
+
+        Args:
+            names (str or List[str], optional): Datasets to prune, all datasets by default
+            keep_archive (bool): Only remove the extracted tables and keep the downloaded ZIP
+        """
+        freed = 0
+        for name in self._check_names(names):
+            dataset_root = self.dataset_root(name)
+            if not os.path.isdir(dataset_root):
+                continue
+            zip_path = os.path.join(dataset_root, name)
+            extract_folder = os.path.join(dataset_root, "extracted")
+            # Take the same locks as preparation so we never race a download or extraction
+            with _FileLock(zip_path + ".lock"), _FileLock(extract_folder + ".lock"):
+                before = _dir_size(dataset_root)
+                for entry in os.listdir(dataset_root):
+                    path = os.path.join(dataset_root, entry)
+                    if entry.endswith(".lock"):
+                        continue
+                    if keep_archive and entry == name:
+                        continue
+                    if os.path.isdir(path):
+                        shutil.rmtree(path)
+                    else:
+                        os.remove(path)
+                freed += before - _dir_size(dataset_root)
+        return freed
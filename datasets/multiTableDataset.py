@@ -1,9 +1,11 @@
 import os
+import shutil
 import zipfile
 import csv
 from typing import List, Optional, Dict, Any, Iterator
 from torch.utils.data import IterableDataset
 from reclab._download_hooks import DownloadManager
+from reclab.datasets.utils import _FileLock
 
 class FileIterableDataset(IterableDataset):
             def __init__(self, parent, table_name, delimiter, chunk_size, start, end):
@@ -86,16 +88,30 @@ class MultiTableDataset:
         self._tables_header: Dict[str, Optional[List[str]]] = {}
 
     def _download_if_needed(self):
-        if not os.path.exists(self.zip_path):
-            os.makedirs(os.path.dirname(self.zip_path), exist_ok=True)
+        if os.path.exists(self.zip_path):
+            return
+        os.makedirs(os.path.dirname(self.zip_path), exist_ok=True)
+        with _FileLock(self.zip_path + ".lock"):
+            # Another process may have finished the download while we were waiting
+            if os.path.exists(self.zip_path):
+                return
+            # Download to a side file so an interrupted download never looks complete
+            part_path = self.zip_path + ".part"
             dm = DownloadManager()
-            dm.get_local_path(self.url, self.zip_path)
+            dm.get_local_path(self.url, part_path)
+            os.replace(part_path, self.zip_path)
 
     def _extract_if_needed(self):
         if not os.path.exists(self.extract_folder):
-            os.makedirs(self.extract_folder, exist_ok=True)
-            with zipfile.ZipFile(self.zip_path, 'r') as zf:
-                zf.extractall(self.extract_folder)
+            with _FileLock(self.extract_folder + ".lock"):
+                if not os.path.exists(self.extract_folder):
+                    # Extract into a side folder and rename it once complete
+                    part_folder = self.extract_folder + ".part"
+                    shutil.rmtree(part_folder, ignore_errors=True)
+                    os.makedirs(part_folder, exist_ok=True)
+                    with zipfile.ZipFile(self.zip_path, 'r') as zf:
+                        zf.extractall(part_folder)
+                    os.replace(part_folder, self.extract_folder)
 
         actual_files = os.listdir(self.extract_folder)
         missing = [f for f in self.expected_csv_files if f not in actual_files]
@@ -1,4 +1,12 @@
-from reclab.datasets import BLOG_REC, MOVIE, BOOK
+import os
+import time
+import shutil
+import zipfile
+import tempfile
+import importlib
+import multiprocessing
+from reclab.datasets import BLOG_REC, MOVIE, BOOK, DATASETS, CacheManager
+from reclab._download_hooks import DownloadManager
 from torch.utils.data import DataLoader
 from reclab.data.test_autoFE import FeatureStreaming
 from sklearn.datasets import load_breast_cancer
@@ -40,6 +48,62 @@ def book_test():
         print(data)
     print(f"the tables info are {test_ds.get_table_info('Books.csv')}")
 
+def _fake_get_local_path(self, url, destination):
+    # Write a small local ZIP instead of downloading, and log the URL under the cache root
+    name = [n for n in DATASETS if importlib.import_module("reclab.datasets." + n.lower()).URL == url][0]
+    tables = importlib.import_module("reclab.datasets." + name.lower()).EXPECTED_TABLES
+    root = os.path.dirname(os.path.dirname(os.path.dirname(destination)))
+    with open(os.path.join(root, "downloads.log"), "a") as f:
+        f.write(url + "\n")
+    time.sleep(0.2)  # widen the race window between processes
+    with zipfile.ZipFile(destination, "w") as zf:
+        for table in tables:
+            zf.writestr(table, "id,value\n1,a\n2,b\n")
+
+def _prepare_in_process(root):
+    CacheManager(root).prepare()
+
+def cache_manager_test():
+    original = DownloadManager.get_local_path
+    DownloadManager.get_local_path = _fake_get_local_path
+    root = tempfile.mkdtemp()
+    try:
+        # several processes preparing the same root download every URL only once
+        ctx = multiprocessing.get_context("fork")
+        procs = [ctx.Process(target=_prepare_in_process, args=(root,)) for _ in range(4)]
+        for proc in procs:
+            proc.start()
+        for proc in procs:
+            proc.join()
+            assert proc.exitcode == 0
+        with open(os.path.join(root, "downloads.log")) as f:
+            downloaded = f.read().split()
+        assert sorted(downloaded) == sorted(set(downloaded))
+        assert len(downloaded) == len(DATASETS)
+
+        cm = CacheManager(root)
+        datasets = cm.prepare()
+        assert sorted(datasets) == sorted(DATASETS)
+        for ds in datasets.values():
+            for table in ds.list_tables():
+                assert ds.get_table_header(table) == ["id", "value"]
+                assert ds.get_table_data(table) == [["1", "a"], ["2", "b"]]
+
+        # keep_archive only drops the extracted tables
+        book_root = cm.dataset_root("BOOK")
+        assert cm.prune("BOOK", keep_archive=True) > 0
+        assert os.path.exists(os.path.join(book_root, "BOOK"))
+        assert not os.path.exists(os.path.join(book_root, "extracted"))
+
+        total = cm.total_size()
+        assert total > 0
+        assert cm.prune() == total
+        assert cm.total_size() == 0
+        print(f"cache manager test passed, {len(downloaded)} downloads")
+    finally:
+        DownloadManager.get_local_path = original
+        shutil.rmtree(root, ignore_errors=True)
+
 def test_featureStreaming():
     bk = BOOK()
     loader = DataLoader(bk.iter_loader('Books.csv', start = 1, end = 201))